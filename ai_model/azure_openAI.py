@@ -1,4 +1,6 @@
-from openai import AzureOpenAI
+import asyncio
+import httpx
+from openai import AsyncAzureOpenAI
 import os
 import sys
 import os
@@ -7,13 +9,42 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-client = AzureOpenAI(
-    api_key=os.getenv("AZURE_OPENAI_KEY"),
-    api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
-    azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
-)
+# Async client so LLM calls don't block the event loop the Playwright agents run on;
+# one pooled keep-alive HTTP client is shared by every call on the same event loop.
+# Pooled connections are bound to the loop that opened them, so a new loop (e.g. each
+# asyncio.run in main.invoke) gets its own client; close_azure_client() must run before
+# that loop ends.
+_CLIENT = {"loop": None, "client": None}
 
-def _get_response_from_azure_openAI(system_message, user_message, model="gpt-4", temperature=0.2):
+def _get_client() -> AsyncAzureOpenAI:
+    loop = asyncio.get_running_loop()
+    if _CLIENT["loop"] is not loop:
+        _CLIENT["client"] = AsyncAzureOpenAI(
+            api_key=os.getenv("AZURE_OPENAI_KEY"),
+            api_version=os.getenv("AZURE_OPENAI_API_VERSION"),
+            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+            max_retries=2,
+            timeout=60.0,
+            http_client=httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            ),
+        )
+        _CLIENT["loop"] = loop
+    return _CLIENT["client"]
+
+async def close_azure_client() -> None:
+    """Close the pooled client for the running loop (call before the loop ends)."""
+    client, loop = _CLIENT["client"], _CLIENT["loop"]
+    _CLIENT.update(loop=None, client=None)
+    if client is not None and loop is asyncio.get_running_loop():
+        try:
+            await client.close()
+        except Exception:
+            pass
+
+async def _get_response_from_azure_openAI(system_message, user_message, model="gpt-4", temperature=0.2,
+                                          response_format=None, max_tokens=None):
     """
     Sends system and user messages to the LLM and returns structured testing requirements.
 
@@ -23,17 +54,26 @@ def _get_response_from_azure_openAI(system_message, user_message, model="gpt-4",
         client: The initialized OpenAI client instance.
         model (str, optional): Model name (default: "gpt-4").
         temperature (float, optional): Sampling temperature (default: 0.2).
+        response_format (dict, optional): e.g. {"type": "json_object"} for server-enforced JSON output.
+        max_tokens (int, optional): Upper bound on generated tokens.
 
     Returns:
         str: The text content of the LLM's response.
     """
-    response = client.chat.completions.create(
+    extra = {}
+    if response_format is not None:
+        extra["response_format"] = response_format
+    if max_tokens is not None:
+        extra["max_tokens"] = max_tokens
+
+    response = await _get_client().chat.completions.create(
         model=model,
         messages=[
             {"role": "system", "content": system_message},
             {"role": "user", "content": user_message}
         ],
-        temperature=temperature
+        temperature=temperature,
+        **extra
     )
 
     return response.choices[0].message.content
@@ -5,6 +5,8 @@ import asyncio
 import logging
 from typing import Optional, Dict, Any
 from logging_config import setup_logging, get_agent_logger
+from ai_model.azure_openAI import close_azure_client
+from validators.accessibility_agent import close_shared_browser
 import os  # <-- added
 
 # Initialize logging
@@ -92,4 +94,6 @@ async def startup_event():
 @api.on_event("shutdown")
 async def shutdown_event():
     logger.info("🔄 UI/UX Testing Agent API shutting down...")
+    await close_shared_browser()
+    await close_azure_client()
     logger.info("👋 Goodbye!")
@@ -1,15 +1,43 @@
 # core/orchestrator_agent.py
-from typing import Dict, Any, List
+import asyncio
+import json
+import os
+import uuid
+from typing import Dict, Any, List, Tuple
 from core.action_schema import _classify_intent
 from core.requirement_mapping import requirement_mapping
 from io_library.output import _generate_validation_agent_feedback
 from logging_config import get_agent_logger
+from utility.agent_helper import _ensure_dir, _ts
 from utility.scenario_builder import _build_default_scenarios
-from validators.accessibility_agent import playwright_execution_agent
+from validators.accessibility_agent import playwright_execution_stream
 from validators.branding_ux_validation_agent import enrich_with_branding_ux  # can be a no-op in your repo
 
 logger = get_agent_logger("ORCHESTRATOR")
 
+# Fields kept in memory (and in the API response) per scenario; the full result, including
+# details/issues/fixes, is written to `result_path` as soon as the scenario finishes.
+_SUMMARY_FIELDS = ("scenario_id", "description", "result", "bug_fixed", "bug_status",
+                   "screenshot_path", "axe", "metrics", "fix_count")
+
+def _write_result(path: str, res: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(res, f, ensure_ascii=False, indent=2, default=str)
+
+async def _stream_results_to_disk(exec_state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Persist each scenario result under artifacts/ as it completes; return summaries in scenario order."""
+    _ensure_dir("artifacts")
+    run_id = f"{_ts()}_{uuid.uuid4().hex[:8]}"  # unique even for runs started in the same second
+    summaries: List[Tuple[int, Dict[str, Any]]] = []
+    async for i, res in playwright_execution_stream(exec_state):
+        path = os.path.join("artifacts", f"results-{run_id}-{i:03d}.json")
+        await asyncio.to_thread(_write_result, path, res)
+        summary = {k: res[k] for k in _SUMMARY_FIELDS if k in res}
+        summary["result_path"] = path
+        summaries.append((i, summary))
+    summaries.sort(key=lambda item: item[0])
+    return [summary for _, summary in summaries]
+
 async def orchestrator_run(state: Dict[str, Any]) -> Dict[str, Any]:
     bug_description = (state.get("bug_description") or state.get("input") or "").strip()
     website = (state.get("website") or "").strip()
@@ -20,7 +48,7 @@ async def orchestrator_run(state: Dict[str, Any]) -> Dict[str, Any]:
 
     # 1) Requirements extraction (kept for component awareness)
     try:
-        req_out = requirement_mapping({"input": bug_description or state.get("input", ""), "website": website})
+        req_out = await requirement_mapping({"input": bug_description or state.get("input", ""), "website": website})
         requirements = req_out.get("requirements", {}) if isinstance(req_out, dict) else {}
     except Exception as e:
         logger.error(f"ReqX extraction error: {e}")
@@ -57,14 +85,12 @@ async def orchestrator_run(state: Dict[str, Any]) -> Dict[str, Any]:
     exec_state["website"] = website
     exec_state["enriched_scenarios"] = enriched_scenarios
 
-    logger.info("➡️ Calling accessibility_agent.playwright_execution_agent with %d scenarios", len(enriched_scenarios))
+    logger.info("➡️ Calling accessibility_agent.playwright_execution_stream with %d scenarios", len(enriched_scenarios))
     try:
-        exec_out = await playwright_execution_agent(exec_state)
+        execution_results: List[Dict[str, Any]] = await _stream_results_to_disk(exec_state)
     except Exception as e:
         logger.error(f"Execution error: {e}")
-        exec_out = {"execution_results": []}
-
-    execution_results: List[Dict[str, Any]] = exec_out.get("execution_results", []) or []
+        execution_results = []
 
     return _generate_validation_agent_feedback(website, bug_description, intent, requirements, enriched_scenarios, branding_ux_notes, execution_results)
 
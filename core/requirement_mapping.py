@@ -2,6 +2,10 @@ from dotenv import load_dotenv
 import os
 import json
 import sys
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from ai_model.azure_openAI import _get_response_from_azure_openAI
@@ -13,7 +17,7 @@ from logging_config import (
 load_dotenv()
 
 
-def requirement_mapping(state: dict) -> dict:
+async def requirement_mapping(state: dict) -> dict:
     # Use 'ReqX' to avoid confusion with the UIA classifier/router
     log_agent_start("ReqX", {
         "input_length": len(state["input"]),
@@ -41,7 +45,8 @@ def requirement_mapping(state: dict) -> dict:
     - UX considerations
     - Any special instructions or constraints
 
-    Output as raw JSON only, no explanation or markdown formatting.
+    Return a single JSON object with keys website, components, branding_guidelines,
+    ux_considerations, special_instructions:
     {{
         "website": "{website_url}",
         "components": ["<component 1>", "<component 2>", "..."],
@@ -56,7 +61,10 @@ def requirement_mapping(state: dict) -> dict:
   
     system_msg = "You're an expert test analyst extracting structured testing requirements."
 
-    raw_output = _get_response_from_azure_openAI(system_msg, prompt)
+    # JSON mode: the service guarantees a JSON object, and the small schema needs few tokens
+    raw_output = await _get_response_from_azure_openAI(
+        system_msg, prompt, response_format={"type": "json_object"}, max_tokens=400
+    )
 
     if raw_output is None:
         error_msg = "OpenAI API returned None content"
@@ -66,10 +74,8 @@ def requirement_mapping(state: dict) -> dict:
     log_llm_response("ReqX", raw_output)
     log_agent_thinking("ReqX", "Parsing LLM response into structured format")
     
-    raw_output = raw_output.strip()
-
     try:
-        parsed = json.loads(raw_output)
+        parsed = orjson.loads(raw_output) if orjson is not None else json.loads(raw_output)
         log_agent_thinking("ReqX", f"Successfully parsed requirements: {len(parsed.get('components', []))} components identified")
         
         # Log what was extracted
@@ -2,10 +2,16 @@
 from typing import TypedDict, List, Dict, Any, Optional
 import asyncio
 import logging
+try:
+    import uvloop  # libuv-based event loop: cheaper CDP/websocket round trips (not on Windows)
+except ImportError:
+    uvloop = None
 
 from logging_config import setup_logging, get_agent_logger
 #from agents.orchestrator_agent import orchestrator_run
 from core.orchestrator_agent import orchestrator_run
+from ai_model.azure_openAI import close_azure_client
+from validators.accessibility_agent import close_shared_browser
 
 # ----- logging -----
 setup_logging(log_level=logging.INFO)
@@ -38,9 +44,21 @@ class _SimpleLangGraphApp:
         logger.info("✅ MAIN: orchestrator completed")
         return result
 
+    async def _ainvoke_and_close(self, state: AgentState) -> Dict[str, Any]:
+        # invoke() runs each call on its own event loop, so the shared browser and the
+        # pooled LLM client cannot outlive it
+        try:
+            return await self.ainvoke(state)
+        finally:
+            await close_shared_browser()
+            await close_azure_client()
+
     # (Optional) sync helper if you ever need it
     def invoke(self, state: AgentState) -> Dict[str, Any]:
-        return asyncio.run(self.ainvoke(state))
+        # uvicorn already selects uvloop for the API when it is installed; do the same here
+        if uvloop is not None:
+            return uvloop.run(self._ainvoke_and_close(state))
+        return asyncio.run(self._ainvoke_and_close(state))
 
 # Exported symbols used by api.py
 app = _SimpleLangGraphApp()
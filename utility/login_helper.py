@@ -7,6 +7,11 @@ from typing import Optional
 from playwright.async_api import async_playwright, Page
 from logging_config import (log_playwright_action)
 
+# Accessible name of the app's Sign In trigger
+_SIGN_IN_RE = re.compile(r"sign in", re.I)
+# Microsoft login host (page.wait_for_url / url checks)
+_LOGIN_HOST_RE = re.compile(r"login\.microsoftonline\.com")
+
 
 async def click_sign_in_and_capture_ms_page(main_page: Page, wait_ms: int = 15000) -> Optional[Page]:
     log_playwright_action("🔎 Locating 'Sign In' trigger on app...")
@@ -14,20 +19,19 @@ async def click_sign_in_and_capture_ms_page(main_page: Page, wait_ms: int = 1500
     try:
         async with main_page.context.expect_page() as new_page_info:
             try:
-                await main_page.get_by_role("button", name=re.compile(r"sign in", re.I)).click()
+                await main_page.get_by_role("button", name=_SIGN_IN_RE).click()
                 clicked = True
             except Exception:
                 pass
             if not clicked:
                 try:
-                    await main_page.get_by_role("link", name=re.compile(r"sign in", re.I)).click()
+                    await main_page.get_by_role("link", name=_SIGN_IN_RE).click()
                     clicked = True
                 except Exception:
                     pass
             if not clicked:
-                locator = main_page.locator(
-                    "button:has-text('Sign in'), button:has-text('Sign In'), a:has-text('Sign in'), a:has-text('Sign In')"
-                )
+                # Neither role matched: fall back to any element whose text says "sign in"
+                locator = main_page.get_by_text(_SIGN_IN_RE)
                 if await locator.count():
                     await locator.first.click()
                     clicked = True
@@ -39,16 +43,34 @@ async def click_sign_in_and_capture_ms_page(main_page: Page, wait_ms: int = 1500
         log_playwright_action(f"⚠️ expect_page() did not catch popup/tab: {e}")
 
     log_playwright_action("🔁 Scanning all pages for Microsoft login...")
-    end_time = asyncio.get_event_loop().time() + (wait_ms / 1000)
-    while asyncio.get_event_loop().time() < end_time:
-        for p in main_page.context.pages:
+
+    for p in main_page.context.pages:
+        if _LOGIN_HOST_RE.search(p.url or ""):
+            log_playwright_action(f"✅ Found Microsoft login page by scan: {p.url}")
+            return p
+
+    # Not there yet: wait for a same-tab redirect or a late popup, whichever lands first
+    async def _late_popup() -> Page:
+        p = await main_page.context.wait_for_event("page", timeout=wait_ms)
+        await p.wait_for_url(_LOGIN_HOST_RE, wait_until="commit", timeout=wait_ms)
+        return p
+
+    async def _same_tab() -> Page:
+        await main_page.wait_for_url(_LOGIN_HOST_RE, wait_until="commit", timeout=wait_ms)
+        return main_page
+
+    waiters = [asyncio.ensure_future(_late_popup()), asyncio.ensure_future(_same_tab())]
+    try:
+        for fut in asyncio.as_completed(waiters):
             try:
-                if "login.microsoftonline.com" in (p.url or ""):
-                    log_playwright_action(f"✅ Found Microsoft login page by scan: {p.url}")
-                    return p
+                p = await fut
             except Exception:
-                pass
-        await asyncio.sleep(0.25)
+                continue
+            log_playwright_action(f"✅ Found Microsoft login page by scan: {p.url}")
+            return p
+    finally:
+        for w in waiters:
+            w.cancel()
 
     log_playwright_action("❌ Could not find Microsoft login page after clicking Sign In")
     return None
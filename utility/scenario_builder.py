@@ -11,10 +11,12 @@ def _build_default_scenarios(requirements: Dict[str, Any], website: str) -> List
                 "scenario_id": f"comp_{i}",
                 "description": f"Open {website} and capture state for component: {comp}",
                 "component": comp,
+                "capture_screenshot": True,
             })
     else:
         scenarios.append({
             "scenario_id": "baseline_homepage",
-            "description": f"Open {website} homepage and capture screenshot"
+            "description": f"Open {website} homepage and capture screenshot",
+            "capture_screenshot": True,
         })
     return scenarios
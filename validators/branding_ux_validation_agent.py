@@ -4,26 +4,24 @@ from logging_config import get_agent_logger, log_agent_start, log_agent_thinking
 
 logger = get_agent_logger("BUVA")  # Branding/UX Validation Agent
 
+# Shared, immutable check lists attached to every scenario (serialize as JSON arrays)
+_BRANDING_CHECKS = (
+    "Logo visible and not distorted",
+    "Brand colors used correctly",
+    "Typography matches brand guidelines",
+)
+_UX_CHECKS = (
+    "Interactive elements are keyboard accessible",
+    "Visible focus states on all focusable controls",
+    "Clear feedback on user actions (toasts/labels)",
+)
+
 def _add_branding_ux_checks(scenarios: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Light enrichment: attach 'branding_checks' and 'ux_checks' arrays to each scenario.
     Your Playwright runner ignores them for now, but this is where you'd expand later.
     """
-    enriched: List[Dict[str, Any]] = []
-    for sc in scenarios:
-        sc2 = dict(sc)
-        sc2["branding_checks"] = [
-            "Logo visible and not distorted",
-            "Brand colors used correctly",
-            "Typography matches brand guidelines"
-        ]
-        sc2["ux_checks"] = [
-            "Interactive elements are keyboard accessible",
-            "Visible focus states on all focusable controls",
-            "Clear feedback on user actions (toasts/labels)"
-        ]
-        enriched.append(sc2)
-    return enriched
+    return [{**sc, "branding_checks": _BRANDING_CHECKS, "ux_checks": _UX_CHECKS} for sc in scenarios]
 
 def enrich_with_branding_ux(requirements: Dict[str, Any], scenarios: List[Dict[str, Any]], website: str) -> Dict[str, Any]:
     """